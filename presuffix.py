@@ -1,5 +1,9 @@
 import os
+import re
 import sys
+import itertools
+import time
+import sqlite3
 import winreg
 import ctypes
 import ctypes.wintypes
@@ -8,6 +12,13 @@ from tkinter import messagebox
 from PIL import Image, ImageTk
 import mss 
 
+# Try to import NumPy for automatic title-region detection
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Try to import Tesseract OCR
 try:
     import pytesseract
@@ -15,7 +26,412 @@ try:
 except ImportError:
     TESSERACT_AVAILABLE = False
 
-    
+
+class MetadataStore:
+    """Local SQLite store of per-file OCR text, chosen names and rename history.
+
+    Records are keyed by file identity (device, inode, size, mtime) rather than
+    by path, so a file keeps its history after being renamed or moved on the
+    same volume. When a file's content changes, its record is moved to the new
+    size and mtime, keeping the rename history but dropping the stale OCR text.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS files (
+            id           INTEGER PRIMARY KEY,
+            dev          INTEGER NOT NULL,
+            ino          TEXT NOT NULL,
+            size         INTEGER NOT NULL,
+            mtime_ns     INTEGER NOT NULL,
+            path         TEXT NOT NULL,
+            ocr_text     TEXT,
+            chosen_name  TEXT,
+            updated_at   REAL NOT NULL,
+            UNIQUE (dev, ino, size, mtime_ns)
+        );
+        CREATE TABLE IF NOT EXISTS renames (
+            id         INTEGER PRIMARY KEY,
+            file_id    INTEGER NOT NULL REFERENCES files (id) ON DELETE CASCADE,
+            old_name   TEXT NOT NULL,
+            new_name   TEXT NOT NULL,
+            renamed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS renames_file ON renames (file_id);
+    """
+    # Carry the record of a file over to its new size and mtime after a content change
+    UPDATE_STALE = """
+        UPDATE files SET size = ?, mtime_ns = ?, ocr_text = NULL
+        WHERE dev = ? AND ino = ? AND (size != ? OR mtime_ns != ?)
+    """
+    UPSERT = """
+        INSERT INTO files (dev, ino, size, mtime_ns, path, ocr_text, chosen_name, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (dev, ino, size, mtime_ns) DO UPDATE SET
+            path         = excluded.path,
+            ocr_text     = COALESCE(excluded.ocr_text, files.ocr_text),
+            chosen_name  = COALESCE(excluded.chosen_name, files.chosen_name),
+            updated_at   = excluded.updated_at
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or self.default_path()
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, timeout=5)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(self.SCHEMA)
+
+    @staticmethod
+    def default_path():
+        """Return the database location under the user's local app data folder"""
+        base_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return os.path.join(base_dir, "presuffix", "metadata.db")
+
+    @staticmethod
+    def file_key(file_path):
+        """Return the identity tuple (dev, ino, size, mtime_ns) of a file, or None if it has no file ID.
+
+        The inode is kept as text: NTFS and ReFS file IDs can exceed SQLite's 64-bit INTEGER.
+        Some network and FAT volumes report an inode of 0, which does not identify a file.
+        """
+        st = os.stat(file_path)
+        if not st.st_ino:
+            return None
+        return (st.st_dev, str(st.st_ino), st.st_size, st.st_mtime_ns)
+
+    def lookup(self, file_path):
+        """Return the stored record of an unchanged file, or None if unknown or modified"""
+        key = self.file_key(file_path)
+        if key is None:
+            return None
+        return self.conn.execute(
+            "SELECT * FROM files WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?",
+            key).fetchone()
+
+    def history(self, file_path):
+        """Return the rename history of a file, oldest first, including from before content changes"""
+        key = self.file_key(file_path)
+        if key is None:
+            return []
+        return self.conn.execute(
+            "SELECT r.old_name, r.new_name, r.renamed_at FROM renames r "
+            "JOIN files f ON f.id = r.file_id "
+            "WHERE f.dev = ? AND f.ino = ? "
+            "ORDER BY r.id", key[:2]).fetchall()
+
+    def _upsert(self, file_path, ocr_text=None, chosen_name=None):
+        key = self.file_key(file_path)
+        if key is None:
+            return None
+        dev, ino, size, mtime_ns = key
+        self.conn.execute(self.UPDATE_STALE, (size, mtime_ns, dev, ino, size, mtime_ns))
+        self.conn.execute(self.UPSERT, (*key, os.path.abspath(file_path), ocr_text, chosen_name, time.time()))
+        return key
+
+    def record(self, file_path, ocr_text=None, chosen_name=None):
+        """Insert or update the record of a file; None values keep what is stored"""
+        with self.conn:
+            self._upsert(file_path, ocr_text, chosen_name)
+
+    def record_rename(self, old_path, new_path):
+        """Record that a file was renamed; call after the rename has happened"""
+        with self.conn:
+            key = self._upsert(new_path, chosen_name=os.path.basename(new_path))
+            if key is None:
+                return
+            self.conn.execute(
+                "INSERT INTO renames (file_id, old_name, new_name, renamed_at) "
+                "SELECT id, ?, ?, ? FROM files WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?",
+                (os.path.basename(old_path), os.path.basename(new_path), time.time(), *key))
+
+    def close(self):
+        self.conn.close()
+
+
+def open_metadata_store():
+    """Open the metadata store, or return None if it is unavailable"""
+    try:
+        return MetadataStore()
+    except (sqlite3.Error, OSError) as e:
+        print(f"Metadata store unavailable: {e}")
+        return None
+
+
+def use_metadata_store(action, default=None):
+    """Run action(store) on a short-lived store; store or file errors return default instead of raising"""
+    store = open_metadata_store()
+    if not store:
+        return default
+    try:
+        return action(store)
+    except (sqlite3.Error, OSError, OverflowError, ValueError) as e:
+        print(f"Metadata store error: {e}")
+        return default
+    finally:
+        store.close()
+
+
+class TitleRegionDetector:
+    """Propose title and author regions on a page image from its text-line layout.
+
+    Text lines are found with projection profiles on a downscaled edge mask:
+    row profiles split the page into bands, column profiles split bands into
+    blocks, and the same two cuts repeated inside each block give single lines.
+    Lines are ranked by glyph height and by how close they are to the top.
+    """
+    def __init__(self, max_side=1600, ink_threshold=40, padding=6, max_regions=4,
+                 max_extra_lines=2, max_area_ratio=0.25):
+        self.max_side = max_side
+        self.ink_threshold = ink_threshold
+        self.padding = padding
+        self.max_regions = max_regions
+        self.max_extra_lines = max_extra_lines
+        self.max_area_ratio = max_area_ratio
+
+    @staticmethod
+    def _runs(mask, min_gap=1):
+        """Return (starts, ends) of True runs in a 1-D mask, bridging gaps shorter than min_gap"""
+        padded = np.concatenate(([False], mask, [False]))
+        edges = np.flatnonzero(padded[1:] != padded[:-1])
+        starts, ends = edges[::2], edges[1::2]
+        if min_gap > 1 and len(starts) > 1:
+            keep = np.flatnonzero(np.concatenate(([True], starts[1:] - ends[:-1] >= min_gap)))
+            ends = ends[np.concatenate((keep[1:] - 1, [len(ends) - 1]))]
+            starts = starts[keep]
+        return starts, ends
+
+    @staticmethod
+    def _drop_vertical_runs(ink, min_length):
+        """Clear vertical ink runs of at least min_length rows, such as page or panel edges"""
+        height = ink.shape[0]
+        cols = np.flatnonzero(ink.sum(axis=0) >= min_length)
+        if height < min_length or not cols.size:
+            return ink
+        cumulative = np.zeros((height + 1, cols.size), dtype=np.int16)
+        np.cumsum(ink[:, cols], axis=0, out=cumulative[1:])
+        # Fully inked windows by start row, then every row such a window covers
+        full = (cumulative[min_length:] - cumulative[:-min_length]) == min_length
+        starts = np.zeros((full.shape[0] + 1, cols.size), dtype=np.int16)
+        np.cumsum(full, axis=0, out=starts[1:])
+        rows = np.arange(height)
+        in_run = (starts[np.minimum(rows + 1, full.shape[0])] - starts[np.maximum(rows - min_length + 1, 0)]) > 0
+        ink = ink.copy()
+        ink[:, cols] &= ~in_run
+        return ink
+
+    def _line_rows(self, block):
+        """Return (starts, ends) of text-line rows in a block, each cut at its own ink level"""
+        profile = block.sum(axis=1)
+        starts, ends = [], []
+        for gy1, gy2 in zip(*self._runs(profile >= 2)):
+            # Rows crossed only by ascenders and descenders stay below the cut
+            group = profile[gy1:gy2]
+            row_starts, row_ends = self._runs(group >= max(2, 0.35 * group.max()))
+            starts.extend(gy1 + row_starts)
+            ends.extend(gy1 + row_ends)
+        return starts, ends
+
+    def _find_lines(self, ink):
+        """Return text-line boxes (x1, y1, x2, y2) found in a boolean ink mask"""
+        height, width = ink.shape
+        block_gap = max(3, width // 60)
+        ink = self._drop_vertical_runs(ink, max(24, height // 15))
+        lines = []
+        band_starts, band_ends = self._runs(ink.sum(axis=1) >= 2)
+        for by1, by2 in zip(band_starts, band_ends):
+            block_starts, block_ends = self._runs(ink[by1:by2].any(axis=0), block_gap)
+            for bx1, bx2 in zip(block_starts, block_ends):
+                block = ink[by1:by2, bx1:bx2]
+                for ly1, ly2 in zip(*self._line_rows(block)):
+                    line_height = ly2 - ly1
+                    line = block[ly1:ly2]
+                    seg_starts, seg_ends = self._runs(line.any(axis=0), max(2, int(line_height * 1.5)))
+                    for sx1, sx2 in zip(seg_starts, seg_ends):
+                        lines.append((bx1 + sx1, by1 + ly1, bx1 + sx2, by1 + ly2,
+                                      line[:, sx1:sx2].mean()))
+        return lines
+
+    def _is_text_line(self, line, page_height):
+        x1, y1, x2, y2, density = line
+        h = y2 - y1
+        return 5 <= h <= page_height * 0.15 and x2 - x1 >= 2 * h and 0.05 <= density <= 0.7
+
+    def _extend(self, box, lines, max_gap, similar):
+        """Grow box with up to max_extra_lines of the nearest lines directly above or below it"""
+        x1, y1, x2, y2 = box
+        for _ in range(self.max_extra_lines):
+            # Nearest horizontally overlapping line on each side; a dissimilar one stops that side
+            above = below = None
+            for line in lines:
+                lx1, ly1, lx2, ly2, _ = line
+                if not (lx1 < x2 and lx2 > x1):
+                    continue
+                if ly2 <= y1 and (above is None or ly2 > above[3]):
+                    above = line
+                elif ly1 >= y2 and (below is None or ly1 < below[1]):
+                    below = line
+            candidates = [(y1 - l[3], l) for l in (above,) if l is not None]
+            candidates += [(l[1] - y2, l) for l in (below,) if l is not None]
+            candidates = [(gap, l) for gap, l in candidates if gap <= max_gap and similar(l[3] - l[1])]
+            if not candidates:
+                break
+            _, (lx1, ly1, lx2, ly2, _) = min(candidates, key=lambda c: c[0])
+            x1, y1, x2, y2 = min(x1, lx1), min(y1, ly1), max(x2, lx2), max(y2, ly2)
+        return (x1, y1, x2, y2)
+
+    def detect(self, image):
+        """Return a list of (label, (x1, y1, x2, y2)) proposals in image coordinates, best first"""
+        scale = max(1, -(-max(image.size) // self.max_side))
+        gray = image.convert("L")
+        if scale > 1:
+            gray = gray.reduce(scale)
+        gray = np.asarray(gray, dtype=np.int16)
+        # Horizontal contrast edges mark glyph strokes regardless of page or background colour
+        ink = np.zeros(gray.shape, dtype=bool)
+        ink[:, 1:] = np.abs(np.diff(gray, axis=1)) > self.ink_threshold
+
+        page_height = ink.shape[0]
+        lines = [l for l in self._find_lines(ink) if self._is_text_line(l, page_height)]
+        if not lines:
+            return []
+        lines.sort(key=lambda l: (l[1], l[0]))
+
+        def score(line):
+            return (line[3] - line[1]) * (1.0 - 0.5 * (line[1] + line[3]) / (2 * page_height))
+
+        title = max(lines, key=score)
+        title_h = title[3] - title[1]
+        title_box = self._extend(title[:4], lines, title_h * 2,
+                                 lambda h: abs(h - title_h) <= 0.25 * title_h)
+        proposals = [("title", title_box, title_h)]
+
+        # Author line: first smaller line below the title, overlapping it horizontally
+        for line in lines:
+            h = line[3] - line[1]
+            if line[1] < title_box[3] or h >= 0.9 * title_h:
+                continue
+            if line[1] - title_box[3] > 6 * title_h:
+                break
+            if line[0] < title_box[2] and line[2] > title_box[0]:
+                proposals.append(("author", self._extend(line[:4], lines, h * 0.8,
+                                                         lambda lh: abs(lh - h) <= 0.25 * h), h))
+                break
+
+        # A box spanning much of the page is body text, not a title worth a small OCR crop
+        max_area = self.max_area_ratio * ink.size
+        proposals = [p for p in proposals if (p[1][2] - p[1][0]) * (p[1][3] - p[1][1]) <= max_area]
+
+        # Remaining slots: next best lines outside the proposed boxes
+        def covered(line):
+            return any(b[0] <= line[0] and b[1] <= line[1] and line[2] <= b[2] and line[3] <= b[3]
+                       for _, b, _ in proposals)
+        for line in sorted(lines, key=score, reverse=True):
+            if len(proposals) >= self.max_regions:
+                break
+            if not covered(line):
+                proposals.append(("text", line[:4], line[3] - line[1]))
+
+        # Line boxes hug the x-height, so pad vertically to take in ascenders and descenders
+        width, height = image.size
+        regions = []
+        for label, (x1, y1, x2, y2), h in proposals:
+            pad_x = self.padding
+            pad_y = self.padding + int(0.6 * h * scale)
+            regions.append((label, (max(0, int(x1 * scale) - pad_x), max(0, int(y1 * scale) - pad_y),
+                                    min(width, int(x2 * scale) + pad_x), min(height, int(y2 * scale) + pad_y))))
+        return regions
+
+
+class NameIndex:
+    """Character n-gram index over file names for near-duplicate lookups.
+
+    Each name is reduced to its set of n-grams; an inverted index maps n-grams
+    to paths. A query gathers candidates from its rarest n-grams only, then
+    ranks them by exact Jaccard similarity, so lookups stay fast even when
+    common n-grams are shared by most of the folder.
+    """
+    def __init__(self, n=3, probe_grams=8, max_candidates=500):
+        self.n = n
+        self.probe_grams = probe_grams
+        self.max_candidates = max_candidates
+        self.grams = {}     # path -> frozenset of n-grams
+        self.postings = {}  # n-gram -> set of paths
+
+    def _ngrams(self, name):
+        stem = os.path.splitext(name)[0].lower()
+        text = " " + re.sub(r"[\W_]+", " ", stem).strip() + " "
+        return frozenset(text[i:i + self.n] for i in range(len(text) - self.n + 1))
+
+    def add(self, path):
+        if path in self.grams:
+            self.remove(path)
+        grams = self._ngrams(os.path.basename(path))
+        self.grams[path] = grams
+        for gram in grams:
+            self.postings.setdefault(gram, set()).add(path)
+
+    def remove(self, path):
+        for gram in self.grams.pop(path, ()):
+            paths = self.postings[gram]
+            paths.discard(path)
+            if not paths:
+                del self.postings[gram]
+
+    @staticmethod
+    def list_files(directory, recursive=False):
+        """Yield the file paths in a directory, optionally including subdirectories.
+
+        Unreadable directories are skipped, as os.walk does for subdirectories.
+        """
+        if recursive:
+            for dirpath, _, filenames in os.walk(directory):
+                for filename in filenames:
+                    yield os.path.join(dirpath, filename)
+            return
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            return
+
+    def add_directory(self, directory, recursive=False):
+        """Index the files in a directory, optionally including subdirectories"""
+        for path in self.list_files(directory, recursive):
+            self.add(path)
+
+    def query(self, name, limit=3, min_score=0.6, exclude=()):
+        """Return up to limit (score, path) pairs of names similar to name, best first"""
+        query_grams = self._ngrams(name)
+        probes = sorted((g for g in query_grams if g in self.postings), key=lambda g: len(self.postings[g]))
+        candidates = set()
+        for gram in probes[:self.probe_grams]:
+            room = self.max_candidates - len(candidates)
+            if room <= 0:
+                break
+            candidates.update(itertools.islice(self.postings[gram], room))
+
+        # Jaccard >= min_score bounds the candidate's n-gram count
+        size = len(query_grams)
+        min_size, max_size = size * min_score, size / min_score if min_score else float("inf")
+        matches = []
+        for path in candidates:
+            grams = self.grams[path]
+            if not min_size <= len(grams) <= max_size or path in exclude:
+                continue
+            shared = len(query_grams & grams)
+            score = shared / (size + len(grams) - shared)
+            if score >= min_score:
+                matches.append((score, path))
+        matches.sort(reverse=True)
+        return matches[:limit]
+
+
 class ScreenCapture:
     def __init__(self, root, source_file_path=None):
         self.root = root
@@ -28,6 +444,11 @@ class ScreenCapture:
         self.canvas = None
         self.screenshot = None
         self.monitor_bbox = None       
+        self.previous_record = None
+        self.proposals = []
+        self.proposal_index = 0
+        self.proposal_items = []
+        self.name_index = None
      
     @staticmethod
     def get_current_monitor_bbox():
@@ -97,15 +518,64 @@ class ScreenCapture:
         self.photo = ImageTk.PhotoImage(self.screenshot)
         self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
 
-        # Mouse bindings
+        # Suggested title/author regions
+        self.show_proposals()
+
+        # Mouse and keyboard bindings
         self.canvas.bind("<Button-1>", self.on_click)
         self.canvas.bind("<B1-Motion>", self.on_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_release)
         self.root.bind("<Escape>", self.cancel_capture)
+        self.root.bind("<Return>", self.accept_proposal)
+        self.root.bind("<Tab>", self.next_proposal)
 
         self.canvas.update()
+
+    def show_proposals(self):
+        """Detect text regions on the screenshot and outline them (Enter to accept, Tab to cycle)"""
+        if not NUMPY_AVAILABLE:
+            return
+        try:
+            self.proposals = TitleRegionDetector().detect(self.screenshot)
+        except Exception:
+            self.proposals = []
+        self.proposal_index = 0
+        self.draw_proposals()
+
+    def draw_proposals(self):
+        self.clear_proposals()
+        for i, (label, (x1, y1, x2, y2)) in enumerate(self.proposals):
+            selected = i == self.proposal_index
+            color = "red" if selected else "yellow"
+            self.proposal_items.append(self.canvas.create_rectangle(
+                x1, y1, x2, y2, outline=color, width=3 if selected else 2, dash=() if selected else (4, 4)))
+            self.proposal_items.append(self.canvas.create_text(
+                x1, y1 - 2, anchor=tk.SW, text=label, fill=color, font=("Arial", 10, "bold")))
+
+    def clear_proposals(self):
+        for item in self.proposal_items:
+            self.canvas.delete(item)
+        self.proposal_items = []
+
+    def next_proposal(self, event):
+        if self.proposals:
+            self.proposal_index = (self.proposal_index + 1) % len(self.proposals)
+            self.draw_proposals()
+        return "break"
+
+    def accept_proposal(self, event):
+        """Run OCR on the selected suggested region"""
+        if not self.proposals:
+            return
+        _, bbox = self.proposals[self.proposal_index]
+        cropped = self.screenshot.crop(bbox)
+        self.close_capture()
+        self.perform_ocr(cropped)
                         
     def on_click(self, event):
+        # A manual selection replaces the suggestions
+        self.clear_proposals()
+        self.proposals = []
         self.start_x = event.x
         self.start_y = event.y
         
@@ -196,6 +666,12 @@ class ScreenCapture:
                 "No text detected in the selected region.\n\n"
                 "Tips:\n• Ensure good contrast\n• Avoid rotated text\n• Try smaller regions"
             )
+        elif self.source_file_path and os.path.exists(self.source_file_path):
+            # Keep what was stored for this file before overwriting it with the new OCR text
+            def swap_record(store):
+                self.previous_record = store.lookup(self.source_file_path)
+                store.record(self.source_file_path, ocr_text=text)
+            use_metadata_store(swap_record)
 
         # Show results in editor
         self.show_text_editor(text, image)
@@ -230,6 +706,7 @@ class ScreenCapture:
         
         # Bind preview updates if file controls exist
         if has_source_file:
+            self._build_name_index(editor)
             self._bind_preview_updates(text_box, editor)
 
     def _create_file_controls(self, frame, editor):
@@ -242,15 +719,32 @@ class ScreenCapture:
         tk.Label(button_frame, text=f"Source file: {current_filename}", 
                 font=("Arial", 9), fg="gray").pack(side=tk.TOP, anchor=tk.W)
         
+        # Last rename recorded for this file, if any
+        last_rename = self._last_rename()
+        if last_rename:
+            tk.Label(button_frame, text=f"Previously renamed from: {last_rename['old_name']}",
+                    font=("Arial", 9), fg="gray").pack(side=tk.TOP, anchor=tk.W)
+        
         # Preview label
         self.preview_label = tk.Label(button_frame, text="Preview: ", 
                                     font=("Arial", 9), fg="blue")
         self.preview_label.pack(side=tk.TOP, anchor=tk.W)
         
+        # Near-duplicate names label
+        self.similar_label = tk.Label(button_frame, text="", font=("Arial", 9), fg="#E65100",
+                                    justify=tk.LEFT)
+        self.similar_label.pack(side=tk.TOP, anchor=tk.W)
+        
         # Rename button
         tk.Button(button_frame, text="Rename File", command=lambda: self._rename_file(editor),
                 bg="#4CAF50", fg="white", font=("Arial", 10)).pack(side=tk.LEFT, padx=5, pady=5)
         
+        # Offer the OCR text stored from an earlier run on this file
+        previous_text = self.previous_record["ocr_text"] if self.previous_record else None
+        if previous_text:
+            tk.Button(button_frame, text="Previous OCR", command=lambda: self._use_previous_ocr(previous_text),
+                    bg="#FF9800", fg="white", font=("Arial", 10)).pack(side=tk.LEFT, padx=5, pady=5)
+        
         # Prefix buttons
         context_handler = ContextMenuHandler()
         for prefix in context_handler.prefix_options:
@@ -264,6 +758,45 @@ class ScreenCapture:
             tk.Button(button_frame, text=label, command=lambda p=suffix: self._add_suffix(p),
                     bg="#2196F3", fg="white", font=("Arial", 10)).pack(side=tk.LEFT, padx=5, pady=5)
 
+    def _last_rename(self):
+        """Return the most recent rename recorded for the source file, or None"""
+        history = use_metadata_store(lambda store: store.history(self.source_file_path), [])
+        return history[-1] if history else None
+
+    def _use_previous_ocr(self, text):
+        """Replace the editor text with OCR text stored from an earlier run"""
+        self.text_box.edit_separator()
+        self.text_box.delete("1.0", tk.END)
+        self.text_box.insert("1.0", self._text_to_filename(text))
+        self._update_preview()
+
+    def _build_name_index(self, editor, time_slice=0.01):
+        """Index names in the source folder, and the library root if set, in short slices between UI events"""
+        self.name_index = NameIndex()
+        paths = NameIndex.list_files(os.path.dirname(self.source_file_path))
+        library_root = ContextMenuHandler().library_root
+        if library_root and os.path.isdir(library_root):
+            paths = itertools.chain(paths, NameIndex.list_files(library_root, recursive=True))
+        index_job = None
+
+        def index_slice():
+            nonlocal index_job
+            deadline = time.perf_counter() + time_slice
+            for path in paths:
+                self.name_index.add(path)
+                if time.perf_counter() >= deadline:
+                    index_job = editor.after(1, index_slice)
+                    return
+            index_job = None
+            self._update_preview()
+
+        def cancel_indexing(event):
+            if event.widget is editor and index_job is not None:
+                editor.after_cancel(index_job)
+
+        editor.bind("<Destroy>", cancel_indexing, add="+")
+        index_job = editor.after(1, index_slice)
+
     def _create_text_editor(self, frame, text):
         """Create the main text editor with scrollbar"""
         text_frame = tk.Frame(frame)
@@ -306,12 +839,14 @@ class ScreenCapture:
             new_name = self.text_box.get(1.0, tk.END).strip()
             if not new_name:
                 self.preview_label.config(text="Preview: ")
+                self.similar_label.config(text="")
                 return
             
             # Clean and validate filename
             cleaned_name = self._clean_filename(new_name)
             if not cleaned_name:
                 self.preview_label.config(text="Preview: ")
+                self.similar_label.config(text="")
                 return
             
             # Add extension and check for duplicates
@@ -329,9 +864,19 @@ class ScreenCapture:
                 display_name = f"{name_without_ext} (1){ext}"
             
             self.preview_label.config(text=f"Preview: {display_name}")
+            self._update_similar(cleaned_name, new_file_path)
             
         except Exception:
             self.preview_label.config(text="Preview: ")
+            self.similar_label.config(text="")
+
+    def _update_similar(self, name, new_file_path):
+        """Show existing file names that nearly match the new name"""
+        if not self.name_index:
+            return
+        matches = self.name_index.query(name, exclude={self.source_file_path, new_file_path})
+        lines = [f"{os.path.basename(path)} ({score:.0%})" for score, path in matches]
+        self.similar_label.config(text="Similar: " + "\n         ".join(lines) if lines else "")
 
     def _clean_filename(self, filename):
         """Clean filename by removing invalid characters and whitespace"""
@@ -375,6 +920,7 @@ class ScreenCapture:
         
         try:
             os.rename(self.source_file_path, new_file_path)
+            use_metadata_store(lambda store: store.record_rename(self.source_file_path, new_file_path))
             messagebox.showinfo("Success", f"File renamed to:\n{os.path.basename(new_file_path)}")
             editor.destroy()
         except Exception as e:
@@ -414,6 +960,7 @@ class ContextMenuHandler:
         self.prefix_options = ["+Book+year+", "+Paper+year+", "+Thesis+year+", "+Report+year+", 
                                "+Slides+year+", "+Presentation+year+", "+Draft+year+"]
         self.suffix_options = ["+authors"]  
+        self.library_root = None  # Optional folder searched recursively for similar names in the OCR editor
         self.menu_name = "Add Prefix-Suffix and OCR"
         self.ocr_menu_name = "Tesseract OCR"
         self.python_executable = sys.executable
@@ -574,6 +1121,7 @@ class ContextMenuHandler:
             counter += 1
         
         os.rename(file_path, new_file_path)
+        self._record_rename(file_path, new_file_path)
         return True
                 
     def add_suffix(self, suffix, file_path):
@@ -592,7 +1140,12 @@ class ContextMenuHandler:
             counter += 1
         
         os.rename(file_path, new_file_path)
+        self._record_rename(file_path, new_file_path)
         return True
+    
+    def _record_rename(self, old_path, new_path):
+        """Record a rename in the metadata store without letting store errors fail the rename"""
+        use_metadata_store(lambda store: store.record_rename(old_path, new_path))
             
     def start_ocr(self, source_file_path=None):
         """Start the OCR region selection process"""
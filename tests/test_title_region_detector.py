@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("winreg")
+pytest.importorskip("mss")
+pytest.importorskip("numpy")
+
+from PIL import Image, ImageDraw, ImageFont
+
+from presuffix import TitleRegionDetector
+
+TITLE_Y = 120
+TITLE_STEP = 90
+
+
+def render_page(title_lines, background):
+    """Render a 4K frame with a white page on the given background, returning it and the author line's y range"""
+    image = Image.new("RGB", (3840, 2160), background)
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((960, 0, 2880, 2160), fill="white")
+
+    y = TITLE_Y
+    for line in title_lines:
+        draw.text((1060, y), line, font=ImageFont.load_default(size=64), fill="black")
+        y += TITLE_STEP
+
+    author_font = ImageFont.load_default(size=30)
+    author_y = y + 40
+    draw.text((1060, author_y), "J. Doe", font=author_font, fill="black")
+    _, top, _, bottom = draw.textbbox((1060, author_y), "J. Doe", font=author_font)
+
+    body_font = ImageFont.load_default(size=24)
+    for i in range(45):
+        draw.text((1060, y + 160 + i * 34),
+                  "Lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut",
+                  font=body_font, fill="black")
+    return image, (top, bottom)
+
+
+@pytest.mark.parametrize("background", [(80, 80, 80), "white"])
+def test_author_found_on_page_with_contrasting_background(background):
+    image, (author_top, author_bottom) = render_page(["Deep Learning For Image Renaming"], background)
+
+    regions = dict(TitleRegionDetector().detect(image))
+
+    x1, y1, x2, y2 = regions["author"]
+    assert y1 <= author_top and author_bottom <= y2
+    assert x2 - x1 < 300  # the short author line, not a line of body text
+
+
+def test_two_line_title_is_one_region():
+    image, (author_top, _) = render_page(
+        ["Deep Learning For Image Renaming", "At Scale With Projection Profiles"], (80, 80, 80))
+
+    regions = TitleRegionDetector().detect(image)
+
+    label, (_, y1, _, y2) = regions[0]
+    assert label == "title"
+    assert y1 <= TITLE_Y + 20 and TITLE_Y + TITLE_STEP + 40 <= y2 < author_top
+    assert all(label != "text" or box[1] >= y2 for label, box in regions)